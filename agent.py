@@ -1,6 +1,7 @@
 # agent.py
 from algorithms import a_star_pathfinding, is_path_safe, hamiltonian_move, greedy_survival_move, _calculate_space_size
-from mcts import mcts_search
+from mcts import mcts_search_anytime
+from config import MCTS_TIME_BUDGET, MCTS_MAX_SIMULATIONS, MCTS_MIN_VISITS_PER_MOVE
 
 class AIController:
     def __init__(self):
@@ -54,13 +55,17 @@ class AIController:
         # --- 3. 执行最终选择的算法 ---
         action = None
         path = None
+        mcts_stats = None
         if self.chosen_algorithm == 'A_STAR':
             path = scores['A_STAR']['path']
             action = path[0]
         elif self.chosen_algorithm == 'HAMILTONIAN':
             action = hamiltonian_move(snake)
         elif self.chosen_algorithm == 'MCTS':
-            action = mcts_search(game, game_state, num_simulations=100)
+            action, mcts_stats = mcts_search_anytime(game, game_state,
+                                                     num_simulations=MCTS_MAX_SIMULATIONS,
+                                                     time_budget=MCTS_TIME_BUDGET,
+                                                     min_visits_per_move=MCTS_MIN_VISITS_PER_MOVE)
         else: # SURVIVAL
             action = greedy_survival_move(snake, game_state['direction'])
 
@@ -70,7 +75,8 @@ class AIController:
             "algorithm_scores": {k: v['score'] for k, v in scores.items()},
             "weights": self.weights,
             "available_space": available_space,
-            "snake_length": len(snake)
+            "snake_length": len(snake),
+            "mcts_stats": mcts_stats
         }
         
         return action, path, debug_info
@@ -22,6 +22,11 @@ YELLOW = (255, 255, 0) # 用于高亮
 # --- 游戏速度 ---
 SPEED = 120 # 稍微提高速度，让AI表现更流畅
 
+# --- MCTS搜索预算 ---
+MCTS_TIME_BUDGET = 0.75 / SPEED # 每次决策思考时间的软目标(秒)，占一帧的3/4，剩下的留给A*、空间计算和绘制
+MCTS_MIN_VISITS_PER_MOVE = 3 # 每个合法走法至少模拟的次数，保证时间再紧也不是随便选一个
+MCTS_MAX_SIMULATIONS = 100 # 每次决策最多的模拟次数
+
 # --- 字体设置 ---
 # FONT_TITLE_SIZE = 22
 # FONT_NORMAL_SIZE = 18
\ No newline at end of file
@@ -110,6 +110,10 @@ class SnakeGame:
         self._draw_text(f"Space: {info['available_space']}", self.font_normal, WHITE, panel_x + 10, y_pos, align="left")
         y_pos += 25
         self._draw_text(f"Length: {info['snake_length']}", self.font_normal, WHITE, panel_x + 10, y_pos, align="left")
+        y_pos += 25
+        mcts_stats = info['mcts_stats']
+        mcts_text = f"Sims: {mcts_stats['simulations']} ({mcts_stats['stop_reason']})" if mcts_stats else "Sims: -"
+        self._draw_text(mcts_text, self.font_normal, WHITE, panel_x + 10, y_pos, align="left")
         y_pos += 40
 
         # 3. 绘制算法决策
@@ -2,7 +2,10 @@
 
 import math
 import random
+import time
 from collections import namedtuple
+from config import GRID_WIDTH, GRID_HEIGHT
+from algorithms import greedy_survival_move
 
 Point = namedtuple('Point', 'x, y')
 
@@ -49,7 +52,7 @@ class MCTSNode:
         WINDOW_WIDTH, WINDOW_HEIGHT = 640, 480
         x, y = head_pos
         if not (0 <= x < WINDOW_WIDTH and 0 <= y < WINDOW_HEIGHT): return True
-        if Point(x, y) in snake: return True
+        if head_pos in snake: return True # Point是namedtuple，可以直接和元组比较
         return False
 
     def select_child(self):
@@ -73,13 +76,89 @@ class MCTSNode:
         self.visits += 1
         self.wins += result
 
-def mcts_search(game, initial_state, num_simulations=50):
+def _rollout_depth(snake):
     """
-    MCTS主函数
+    根据蛇长和棋盘大小决定随机模拟的最大步数
+    至少要能横穿一次棋盘，再加上蛇身长度（让尾巴有机会让开路），但不超过剩余空格数
     """
+    free_cells = GRID_WIDTH * GRID_HEIGHT - len(snake)
+    return max(1, min(free_cells, GRID_WIDTH + GRID_HEIGHT + len(snake)))
+
+def _can_be_overtaken(root, remaining):
+    """
+    判断在剩余的模拟次数内，访问次数第二多的子节点是否还有可能追上第一名
+    最终按访问次数选择，所以差距大于剩余次数时结果已经确定
+    """
+    if root.untried_moves:
+        return True  # 还有没试过的走法
+    visits = sorted((c.visits for c in root.children), reverse=True)
+    if len(visits) < 2:
+        return False
+    return visits[0] - visits[1] <= remaining
+
+def mcts_search(game, initial_state, num_simulations=50, time_budget=None, min_visits_per_move=3):
+    """
+    MCTS主函数，只返回最佳移动（参数含义见 mcts_search_anytime）
+    """
+    move, _ = mcts_search_anytime(game, initial_state, num_simulations=num_simulations,
+                                  time_budget=time_budget, min_visits_per_move=min_visits_per_move)
+    return move
+
+def mcts_search_anytime(game, initial_state, num_simulations=None, time_budget=None, min_visits_per_move=3):
+    """
+    可随时中断的MCTS：在模拟次数预算和/或时间预算（秒）内搜索
+    两个预算都不给时默认跑50次模拟
+    不管时间预算多少，都会先跑满 min_visits_per_move × 合法移动数 次模拟（不超过模拟次数预算），
+    让每个走法平均至少分到几次评估，所以时间预算是一个软目标
+    满足以下任一条件会提前结束：
+      - 只有一个合法移动
+      - 领先的子节点在剩余预算内已经不可能被超越
+    返回 (最佳移动, 统计信息)，统计信息里记录实际跑了多少次模拟
+    """
+    if num_simulations is None and time_budget is None:
+        num_simulations = 50
+
+    start_time = time.perf_counter()
     root = MCTSNode(state=initial_state)
+    min_simulations = min_visits_per_move * len(root.untried_moves)
+    if num_simulations is not None:
+        min_simulations = min(min_simulations, num_simulations)
+    rollout_depth = _rollout_depth(initial_state['snake'])
+    stats = {'simulations': 0, 'elapsed': 0.0, 'stop_reason': 'budget', 'rollout_depth': rollout_depth}
+
+    if len(root.untried_moves) == 1:
+        stats['stop_reason'] = 'single_move'
+        stats['elapsed'] = time.perf_counter() - start_time
+        return root.untried_moves[0], stats
+
+    slowest_simulation = 0.0  # 目前为止最慢的一次模拟耗时，用来保守地估算剩余时间
+    last_time = start_time
+    while True:
+        simulations_done = stats['simulations']
+        now = time.perf_counter()
+        if simulations_done > 0:
+            slowest_simulation = max(slowest_simulation, now - last_time)
+        last_time = now
+
+        # 先跑满最少的模拟次数，之后才检查预算
+        if simulations_done >= min_simulations:
+            # 估算剩余预算还能跑多少次模拟
+            remaining = math.inf
+            if num_simulations is not None:
+                remaining = num_simulations - simulations_done
+            if time_budget is not None:
+                time_left = time_budget - (now - start_time)
+                if time_left <= 0:
+                    remaining = 0
+                elif slowest_simulation > 0:
+                    # 按最慢的一次估算，只算能完整跑完的模拟次数
+                    remaining = min(remaining, math.floor(time_left / slowest_simulation))
+            if remaining < 1:
+                break
+            if not _can_be_overtaken(root, remaining):
+                stats['stop_reason'] = 'decided'
+                break
 
-    for _ in range(num_simulations):
         node = root
         # 每次模拟都从根节点的真实状态开始复制
         simulation_state = {
@@ -112,8 +191,8 @@ def mcts_search(game, initial_state, num_simulations=50):
         if not is_simulation_over:
             # 从当前扩展出的新节点开始，随机走棋直到游戏结束
             rollout_state = simulation_state.copy()
-            for _ in range(100): # 最多模拟100步
-                moves = MCTSNode(rollout_state).get_legal_moves()
+            for _ in range(rollout_depth): # 最多模拟的步数随蛇长和棋盘大小变化
+                moves = MCTSNode(rollout_state).untried_moves # 构造节点时已经算好了合法移动
                 if not moves: 
                     simulation_reward = -1 # 困死了，给个惩罚
                     break
@@ -130,10 +209,15 @@ def mcts_search(game, initial_state, num_simulations=50):
             node.update(simulation_reward)
             node = node.parent
 
+        stats['simulations'] += 1
+
+    stats['elapsed'] = time.perf_counter() - start_time
+
     # 所有模拟结束后，选择访问次数最多的子节点的移动作为最佳移动
     if not root.children:
-        # 如果没有任何可选的子节点（比如开局就被困死），随便走一步
-        return root.get_legal_moves()[0]
-        
-    best_child = sorted(root.children, key=lambda c: c.visits)[-1]
-    return best_child.move
+        # 如果没有任何可选的子节点（比如开局就被困死），退回到贪心生存算法
+        return greedy_survival_move(initial_state['snake'], initial_state['direction']), stats
+
+    # 访问次数相同时，选平均收益更高的
+    best_child = sorted(root.children, key=lambda c: (c.visits, c.wins / c.visits))[-1]
+    return best_child.move, stats
@@ -0,0 +1,107 @@
+# test_mcts.py
+
+import random
+from collections import namedtuple
+import pytest
+from config import GRID_WIDTH, GRID_HEIGHT, GRID_SIZE
+from mcts import mcts_search, mcts_search_anytime, _rollout_depth
+
+Point = namedtuple('Point', 'x, y')
+
+class StubGame:
+    """只实现MCTS用到的部分（height 和 simulate_step），不需要pygame"""
+    height = GRID_HEIGHT * GRID_SIZE
+
+    def simulate_step(self, current_state, action):
+        snake = list(current_state['snake'])
+        food = current_state['food']
+        x, y = snake[0].x, snake[0].y
+        if action == 'RIGHT': x += GRID_SIZE
+        elif action == 'LEFT': x -= GRID_SIZE
+        elif action == 'DOWN': y += GRID_SIZE
+        elif action == 'UP': y -= GRID_SIZE
+        new_head = Point(x, y)
+        snake.insert(0, new_head)
+        if not (0 <= x < GRID_WIDTH * GRID_SIZE and 0 <= y < self.height) or new_head in snake[1:]:
+            return None, -10, True
+        reward = 0
+        if new_head == food:
+            reward = 10
+        else:
+            snake.pop()
+        return {'snake': snake, 'food': food, 'direction': action}, reward, False
+
+def make_state(length=3, food=Point(0, 0)):
+    head_x, head_y = 16 * GRID_SIZE, 12 * GRID_SIZE
+    snake = [Point(head_x - i * GRID_SIZE, head_y) for i in range(length)]
+    return {'snake': snake, 'food': food, 'direction': 'RIGHT'}
+
+def make_dead_end_state():
+    # 蛇头在右下角附近，只能往上或往右；往右走会进入被身体围住的死角
+    w, h = GRID_WIDTH * GRID_SIZE, GRID_HEIGHT * GRID_SIZE
+    head = Point(w - 2 * GRID_SIZE, h - 2 * GRID_SIZE)
+    snake = [head,
+             Point(head.x - GRID_SIZE, head.y),
+             Point(head.x - GRID_SIZE, head.y + GRID_SIZE),
+             Point(head.x, head.y + GRID_SIZE),
+             Point(head.x + GRID_SIZE, head.y + GRID_SIZE),
+             Point(head.x + GRID_SIZE, head.y - GRID_SIZE),
+             Point(head.x + GRID_SIZE, head.y - 2 * GRID_SIZE)]
+    return {'snake': snake, 'food': Point(0, 0), 'direction': 'RIGHT'}
+
+@pytest.fixture(autouse=True)
+def fixed_seed():
+    random.seed(0)
+
+def test_rollout_depth_grows_with_snake_and_is_bounded_by_free_cells():
+    short = _rollout_depth([Point(0, 0)] * 3)
+    long = _rollout_depth([Point(0, 0)] * 30)
+    assert short == GRID_WIDTH + GRID_HEIGHT + 3
+    assert long > short
+    cells = GRID_WIDTH * GRID_HEIGHT
+    assert _rollout_depth([Point(0, 0)] * (cells - 5)) == 5
+    assert _rollout_depth([Point(0, 0)] * cells) == 1
+
+def test_single_legal_move_returns_without_searching():
+    # 蛇头在左上角，只能往下走
+    state = {'snake': [Point(0, 0), Point(20, 0), Point(20, 20)], 'food': Point(300, 300), 'direction': 'LEFT'}
+    move, stats = mcts_search_anytime(StubGame(), state, num_simulations=100)
+    assert move == 'DOWN'
+    assert stats['simulations'] == 0
+    assert stats['stop_reason'] == 'single_move'
+
+def test_simulation_budget_is_respected():
+    move, stats = mcts_search_anytime(StubGame(), make_state(), num_simulations=7, min_visits_per_move=0)
+    assert move in ('UP', 'DOWN', 'RIGHT')
+    assert stats['simulations'] <= 7
+
+def test_stops_early_when_leader_cannot_be_overtaken():
+    move, stats = mcts_search_anytime(StubGame(), make_dead_end_state(), num_simulations=1000)
+    assert move == 'UP'
+    assert stats['stop_reason'] == 'decided'
+    assert stats['simulations'] < 1000
+
+def test_zero_time_budget_still_runs_minimum_simulations():
+    _, stats = mcts_search_anytime(StubGame(), make_state(), time_budget=0, min_visits_per_move=2)
+    # 蛇头朝右，有 UP/DOWN/RIGHT 三个合法移动
+    assert stats['simulations'] == 2 * 3
+    assert stats['stop_reason'] == 'budget'
+
+def test_time_budget_stops_search():
+    _, stats = mcts_search_anytime(StubGame(), make_state(), time_budget=0.005)
+    assert stats['simulations'] >= 3 * 3
+    assert stats['elapsed'] < 0.1
+
+def test_avoids_dead_end():
+    assert mcts_search(StubGame(), make_dead_end_state(), num_simulations=50) == 'UP'
+
+def test_visit_ties_are_broken_by_mean_reward():
+    # 每个走法只访问一次时，不能只看谁最后被扩展，要选平均收益更高（没撞死）的那个
+    # 往上走的随机模拟偶尔也会撞死，这时两边打平，所以只要求绝大多数情况选对
+    up_count = 0
+    for seed in range(20):
+        random.seed(seed)
+        move, stats = mcts_search_anytime(StubGame(), make_dead_end_state(), num_simulations=2, min_visits_per_move=1)
+        assert stats['simulations'] == 2
+        up_count += move == 'UP'
+    assert up_count >= 17